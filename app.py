@@ -1,59 +1,179 @@
 # -*- coding: utf-8 -*-
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import nltk
-from nltk.corpus import stopwords
-import re
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from pydantic import AfterValidator, BaseModel, ConfigDict, TypeAdapter, ValidationError, model_validator
+from sklearn.feature_extraction import FeatureHasher
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+from sklearn.preprocessing import normalize
+from scipy.sparse import csc_matrix, csr_matrix
+import numpy as np
 import logging
-from typing import List
+import time
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Annotated, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; scoring falls back to NumPy slices
+    njit = None
+
+try:
+    import msgpack
+except ImportError:  # MessagePack is optional; clients fall back to JSON on 415
+    msgpack = None
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up the scoring pipeline before the service starts accepting requests."""
+    warm_up()
+    yield
+
 # Initialize FastAPI app
 app = FastAPI(
     title="WorkConnect AI Recommendation Service",
     description="AI-powered job recommendation service using NLP and machine learning",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
-# Download NLTK data on startup
-try:
-    nltk.data.find("corpora/stopwords")
-except LookupError:
-    logger.info("Downloading NLTK stopwords...")
-    nltk.download("stopwords", quiet=True)
+# English stopwords (NLTK's English list)
+ENGLISH_STOPWORDS = frozenset({
+    "i", "me", "my", "myself", "we", "our", "ours", "ourselves", "you", "you're",
+    "you've", "you'll", "you'd", "your", "yours", "yourself", "yourselves", "he", "him",
+    "his", "himself", "she", "she's", "her", "hers", "herself", "it", "it's", "its",
+    "itself", "they", "them", "their", "theirs", "themselves", "what", "which", "who",
+    "whom", "this", "that", "that'll", "these", "those", "am", "is", "are", "was",
+    "were", "be", "been", "being", "have", "has", "had", "having", "do", "does", "did",
+    "doing", "a", "an", "the", "and", "but", "if", "or", "because", "as", "until",
+    "while", "of", "at", "by", "for", "with", "about", "against", "between", "into",
+    "through", "during", "before", "after", "above", "below", "to", "from", "up",
+    "down", "in", "out", "on", "off", "over", "under", "again", "further", "then",
+    "once", "here", "there", "when", "where", "why", "how", "all", "any", "both",
+    "each", "few", "more", "most", "other", "some", "such", "no", "nor", "not", "only",
+    "own", "same", "so", "than", "too", "very", "s", "t", "can", "will", "just", "don",
+    "don't", "should", "should've", "now", "d", "ll", "m", "o", "re", "ve", "y", "ain",
+    "aren", "aren't", "couldn", "couldn't", "didn", "didn't", "doesn", "doesn't",
+    "hadn", "hadn't", "hasn", "hasn't", "haven", "haven't", "isn", "isn't", "ma",
+    "mightn", "mightn't", "mustn", "mustn't", "needn", "needn't", "shan", "shan't",
+    "shouldn", "shouldn't", "wasn", "wasn't", "weren", "weren't", "won", "won't",
+    "wouldn", "wouldn't"
+})
+
+# Byte translation table: uppercase ASCII -> lowercase, other non-alphanumerics -> space
+_ASCII_FOLD_TABLE = bytes(
+    c | 0x20 if 0x41 <= c <= 0x5A
+    else c if 0x30 <= c <= 0x39 or 0x61 <= c <= 0x7A
+    else 0x20
+    for c in range(256)
+)
 
-try:
-    nltk.data.find("tokenizers/punkt")
-except LookupError:
-    logger.info("Downloading NLTK punkt tokenizer...")
-    nltk.download("punkt", quiet=True)
+# Stateless n-gram hashing shared by worker and job documents, so no
+# vocabulary has to be rebuilt per request. 2**16 columns leave plenty of room
+# for skill unigrams and bigrams; every cached JobIndex carries a CSC indptr
+# and an IDF vector sized by this, about 0.5 MB together
+_VECTORIZER = HashingVectorizer(
+    n_features=2 ** 16,
+    ngram_range=(1, 2),  # Include unigrams and bigrams
+    alternate_sign=False,
+    norm=None,
+    lowercase=False,  # Already preprocessed to lowercase
+    dtype=np.float32  # Half the memory traffic of float64 during scoring
+)
 
-# Get English stopwords
-ENGLISH_STOPWORDS = set(stopwords.words("english"))
+# HashingVectorizer.transform rebuilds its analyzer and FeatureHasher on every
+# call; build them once from the configured vectorizer and reuse them
+_ANALYZER = _VECTORIZER.build_analyzer()
+_HASHER = FeatureHasher(
+    n_features=_VECTORIZER.n_features,
+    input_type="string",
+    dtype=_VECTORIZER.dtype,
+    alternate_sign=_VECTORIZER.alternate_sign
+)
+
+def _join_tokens(value: Union[str, List[str]]) -> str:
+    """Join pre-tokenized skills into a single space-separated string."""
+    return value if isinstance(value, str) else " ".join(value)
+
+# Skills may be sent as one string or already split into a list of tokens
+SkillText = Annotated[Union[str, List[str]], AfterValidator(_join_tokens)]
 
 # Pydantic models matching the backend DTOs
 class WorkerProfile(BaseModel):
-    skills: str
+    model_config = ConfigDict(extra="ignore")
+
+    skills: SkillText
 
 class JobPosting(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     id: int
-    required_skills: str
+    required_skills: SkillText
+
+class JobPostingColumns(BaseModel):
+    """Job postings sent column-wise as parallel lists of ids and required skills."""
+    model_config = ConfigDict(extra="ignore")
+
+    ids: List[int]
+    required_skills: List[SkillText]
+
+    @model_validator(mode="after")
+    def check_lengths(self) -> "JobPostingColumns":
+        if len(self.ids) != len(self.required_skills):
+            raise ValueError("ids and required_skills must have the same length")
+        return self
 
 class RecommendationRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     worker_profile: WorkerProfile
-    job_postings: List[JobPosting]
+    job_postings: Union[List[JobPosting], JobPostingColumns]
+
+    def job_columns(self) -> Tuple[Tuple[int, ...], Tuple[str, ...]]:
+        """Return the job postings as parallel (ids, required_skills) tuples."""
+        if isinstance(self.job_postings, JobPostingColumns):
+            return tuple(self.job_postings.ids), tuple(self.job_postings.required_skills)
+        return (
+            tuple(job.id for job in self.job_postings),
+            tuple(job.required_skills for job in self.job_postings),
+        )
 
 class RecommendationResponse(BaseModel):
     ranked_job_ids: List[int]
 
+# Validates raw JSON request bodies directly in pydantic-core, skipping the
+# intermediate json.loads into Python dicts
+_REQUEST_ADAPTER = TypeAdapter(RecommendationRequest)
+
+def _inline_schema_refs(schema: dict) -> dict:
+    """Resolve $defs references so a model schema can be embedded in OpenAPI."""
+    definitions = schema.pop("$defs", {})
+
+    def resolve(node):
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return resolve(definitions[node["$ref"].rsplit("/", 1)[-1]])
+            return {key: resolve(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [resolve(item) for item in node]
+        return node
+
+    return resolve(schema)
+
+@lru_cache(maxsize=16384)
 def preprocess_text(text: str) -> str:
     """
     Preprocess text data for NLP analysis.
+
+    Results are memoized, so repeated skill strings (e.g. the same job
+    postings across requests) are only processed once.
     
     Args:
         text: Raw text input
@@ -64,163 +184,285 @@ def preprocess_text(text: str) -> str:
     if not text or not isinstance(text, str):
         return ""
     
-    # Convert to lowercase
-    text = text.lower()
-    
-    # Remove non-alphanumeric characters (keep spaces)
-    text = re.sub(r"[^a-zA-Z0-9\s]", " ", text)
-    
-    # Replace multiple spaces with single space
-    text = re.sub(r"\s+", " ", text)
-    
-    # Split into words and filter out stopwords
-    words = text.split()
-    filtered_words = [word for word in words if word not in ENGLISH_STOPWORDS and len(word) > 2]
+    # Lowercase and blank out non-alphanumeric characters in a single pass;
+    # non-ASCII characters are encoded as "?" and therefore become spaces
+    words = text.encode("ascii", "replace").translate(_ASCII_FOLD_TABLE).decode("ascii").split()
+
+    # Filter out stopwords and very short words
+    filtered_words = [word for word in words if len(word) > 2 and word not in ENGLISH_STOPWORDS]
     
     return " ".join(filtered_words)
 
-def calculate_similarity_scores(worker_skills: str, job_postings: List[JobPosting]) -> List[tuple]:
+def _vectorize(documents: List[str]) -> csr_matrix:
+    """Hash preprocessed documents into an n-gram count matrix."""
+    return _HASHER.transform(_ANALYZER(doc) for doc in documents)
+
+class JobIndex(NamedTuple):
+    """
+    TF-IDF representation of a job catalog with L2-normalized rows.
+
+    The job matrix is stored column-major, so each column is the posting
+    list (job rows and weights) of one hashed term.
+    """
+    job_ids: np.ndarray
+    transformer: TfidfTransformer
+    postings: csc_matrix
+
+@lru_cache(maxsize=32)
+def _get_job_index(job_ids: Tuple[int, ...], job_skills: Tuple[str, ...]) -> Optional[JobIndex]:
+    """
+    Fit IDF weights over a job catalog and cache the resulting job vectors.
+
+    Args:
+        job_ids: Tuple of job IDs
+        job_skills: Tuple of raw required skills, aligned with job_ids
+
+    Returns:
+        JobIndex for the catalog, or None if no job has meaningful content
+    """
+    documents = [preprocess_text(skills) for skills in job_skills]
+
+    if not any(doc.strip() for doc in documents):
+        return None
+
+    counts = _vectorize(documents)
+    transformer = TfidfTransformer(norm=None)
+    job_matrix = transformer.fit_transform(counts).tocsr().astype(np.float32, copy=False)
+
+    # Normalize once here so cosine similarity reduces to a dot product at query time
+    normalize(job_matrix, norm="l2", copy=False)
+
+    logger.info(f"Built TF-IDF index for {len(job_ids)} jobs")
+    return JobIndex(job_ids=np.array(job_ids, dtype=np.int64), transformer=transformer, postings=job_matrix.tocsc())
+
+def _accumulate_postings(worker_terms, worker_weights, indptr, indices, data, scores):
+    """Add worker_weight * job_weight into scores for every posting of every worker term."""
+    for k in range(worker_terms.shape[0]):
+        term = worker_terms[k]
+        weight = worker_weights[k]
+        for p in range(indptr[term], indptr[term + 1]):
+            scores[indices[p]] += weight * data[p]
+
+# Compiled to machine code when Numba is installed. Worker queries only have
+# a handful of terms, so a serial loop avoids racing on the shared scores array;
+# nogil lets concurrent requests score on separate threads.
+_accumulate_postings_jit = njit(cache=True, fastmath=True, nogil=True)(_accumulate_postings) if njit else None
+
+def _score_jobs(job_index: JobIndex, worker_vector: csr_matrix) -> np.ndarray:
+    """
+    Compute cosine similarity of a worker vector against every indexed job.
+
+    Only the posting lists of the worker's nonzero terms are visited, so the
+    cost scales with the (short) worker query rather than with the size of
+    the whole job matrix. Both sides are L2-normalized, so the accumulated
+    dot products are the cosine similarities.
+
+    Args:
+        job_index: Indexed job catalog
+        worker_vector: L2-normalized 1 x n_features worker TF-IDF row
+
+    Returns:
+        Array of similarity scores aligned with job_index.job_ids
+    """
+    postings = job_index.postings
+    scores = np.zeros(postings.shape[0], dtype=np.float32)
+
+    if _accumulate_postings_jit is not None:
+        _accumulate_postings_jit(
+            worker_vector.indices, worker_vector.data,
+            postings.indptr, postings.indices, postings.data,
+            scores
+        )
+        return scores
+
+    for term, weight in zip(worker_vector.indices, worker_vector.data):
+        start, end = postings.indptr[term], postings.indptr[term + 1]
+        # Each job appears at most once per posting list, so fancy-index += is safe
+        scores[postings.indices[start:end]] += weight * postings.data[start:end]
+
+    return scores
+
+def _no_scores() -> Tuple[np.ndarray, np.ndarray]:
+    """Empty (job_ids, scores) result."""
+    return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+def calculate_similarity_scores(
+    worker_skills: str, job_ids: Sequence[int], job_skills: Sequence[str]
+) -> Tuple[np.ndarray, np.ndarray]:
     """
     Calculate cosine similarity between worker profile and job postings.
 
     Args:
         worker_skills: Preprocessed worker skills string
-        job_postings: List of job postings with required skills
+        job_ids: Job posting IDs
+        job_skills: Raw required skills of each job posting, aligned with job_ids
 
     Returns:
-        List of tuples (job_id, similarity_score)
+        Tuple of aligned arrays (job_ids, similarity_scores); both empty
+        if no similarities could be calculated
     """
-    if not worker_skills.strip() or not job_postings:
+    if not worker_skills.strip() or not job_ids:
         logger.warning("Empty worker skills or no job postings provided")
-        return []
-
-    # Validate job postings
-    valid_jobs = []
-    for job in job_postings:
-        if hasattr(job, 'id') and hasattr(job, 'required_skills') and job.id is not None:
-            valid_jobs.append(job)
-        else:
-            logger.warning(f"Invalid job posting structure: {job}")
-
-    if not valid_jobs:
-        logger.warning("No valid job postings found")
-        return []
-
-    # Prepare documents for vectorization
-    documents = [worker_skills]
-    job_ids = []
-
-    for job in valid_jobs:
-        processed_skills = preprocess_text(job.required_skills)
-        documents.append(processed_skills)
-        job_ids.append(job.id)
-
-    # Check if we have meaningful content to process
-    if len(documents) < 2 or not any(doc.strip() for doc in documents[1:]):
-        logger.warning("No meaningful job content to process after preprocessing")
-        return []
-    
+        return _no_scores()
+
     try:
-        # Create TF-IDF vectorizer with optimized parameters
-        vectorizer = TfidfVectorizer(
-            max_features=min(1000, len(documents) * 50),  # Dynamic vocabulary size
-            ngram_range=(1, 2),  # Include unigrams and bigrams
-            min_df=1,  # Minimum document frequency
-            max_df=0.95,  # Ignore terms that appear in more than 95% of documents
-            stop_words=None,  # We already preprocessed stopwords
-            lowercase=False  # Already preprocessed to lowercase
-        )
+        # Job catalogs change slowly, so the fitted TF-IDF index is cached per catalog
+        job_index = _get_job_index(tuple(job_ids), tuple(job_skills))
 
-        # Fit and transform documents
-        tfidf_matrix = vectorizer.fit_transform(documents)
+        # Check if we have meaningful content to process
+        if job_index is None:
+            logger.warning("No meaningful job content to process after preprocessing")
+            return _no_scores()
 
-        # Validate matrix dimensions
-        if tfidf_matrix.shape[0] < 2:
-            logger.warning("Insufficient documents for similarity calculation")
-            return []
+        job_ids = job_index.job_ids
+        worker_vector = job_index.transformer.transform(_vectorize([worker_skills])).astype(np.float32, copy=False)
 
-        # Calculate cosine similarity between worker profile and all jobs
-        similarities = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:]).flatten()
+        # Unit-normalize the single worker row in place; calling sklearn's
+        # normalize() here costs far more in validation than the math itself
+        worker_norm = np.linalg.norm(worker_vector.data)
+        if worker_norm > 0:
+            worker_vector.data /= worker_norm
+
+        # Cosine similarity between worker profile and all jobs
+        similarities = _score_jobs(job_index, worker_vector)
 
         # Validate similarity scores
         if len(similarities) != len(job_ids):
             logger.error(f"Similarity count mismatch: {len(similarities)} vs {len(job_ids)}")
-            return []
+            return _no_scores()
 
-        # Create list of (job_id, similarity_score) tuples with validation
-        job_similarities = []
-        for job_id, score in zip(job_ids, similarities):
-            if not isinstance(score, (int, float)) or score < 0 or score > 1:
-                logger.warning(f"Invalid similarity score {score} for job {job_id}")
-                continue
-            job_similarities.append((job_id, float(score)))
+        # Drop invalid scores (NaN fails both comparisons); float32 accumulation
+        # can overshoot 1.0 by a rounding error, so clamp first
+        np.minimum(similarities, 1.0, out=similarities)
+        valid = (similarities >= 0) & (similarities <= 1)
+        if not valid.all():
+            logger.warning(f"Invalid similarity scores for jobs {job_ids[~valid].tolist()}")
+            job_ids, similarities = job_ids[valid], similarities[valid]
 
-        logger.info(f"Calculated similarities for {len(job_similarities)} jobs")
-        return job_similarities
+        logger.info(f"Calculated similarities for {len(job_ids)} jobs")
+        return job_ids, similarities
 
     except ValueError as e:
         logger.error(f"Error in TF-IDF vectorization: {str(e)}")
-        return []
+        return _no_scores()
     except Exception as e:
         logger.error(f"Unexpected error in similarity calculation: {str(e)}")
-        return []
+        return _no_scores()
 
-@app.get("/")
-async def root():
-    """Health check endpoint."""
-    return {
-        "message": "WorkConnect AI Recommendation Service is running",
-        "status": "healthy",
-        "version": "1.0.0"
-    }
+def _parse_recommendation_request(content_type: str, body: bytes) -> RecommendationRequest:
+    """
+    Validate a recommendation request body encoded as JSON or MessagePack.
 
-@app.get("/health")
-async def health_check():
-    """Detailed health check endpoint."""
-    return {
-        "status": "healthy",
-        "service": "WorkConnect AI Recommendation Service",
-        "nltk_data": {
-            "stopwords": "available",
-            "punkt": "available"
-        }
-    }
+    Args:
+        content_type: Content-Type header of the request
+        body: Raw request body
+
+    Returns:
+        Validated RecommendationRequest
 
-@app.post("/recommendations/jobs", response_model=RecommendationResponse)
-async def get_job_recommendations(request: RecommendationRequest):
+    Raises:
+        HTTPException: If the body is MessagePack but msgpack is not installed
+        RequestValidationError: If the body is neither JSON nor MessagePack, or
+            fails to decode or validate
     """
-    Get job recommendations based on worker profile and available jobs.
-    
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    is_msgpack = media_type == MSGPACK_MEDIA_TYPE
+    # Same JSON media types FastAPI parses for body parameters
+    is_json = media_type == "application/json" or (
+        media_type.startswith("application/") and media_type.endswith("+json")
+    )
+    if not (is_json or is_msgpack):
+        raise RequestValidationError(
+            [{
+                "type": "model_attributes_type",
+                "loc": ("body",),
+                "msg": "Input should be a valid dictionary or object to extract fields from",
+                "input": None
+            }]
+        )
+
+    try:
+        if is_msgpack:
+            if msgpack is None:
+                raise HTTPException(status_code=415, detail="MessagePack request bodies are not supported")
+            try:
+                payload = msgpack.unpackb(body, raw=False)
+            except ValueError:
+                raise RequestValidationError(
+                    [{"type": "msgpack_invalid", "loc": ("body",), "msg": "Invalid MessagePack body", "input": None}]
+                )
+            return _REQUEST_ADAPTER.validate_python(payload)
+
+        return _REQUEST_ADAPTER.validate_json(body)
+    except ValidationError as e:
+        # Decoded MessagePack can contain bin and ext values (bytes, Timestamp)
+        # that the JSON error response cannot encode, so their inputs are left out
+        raise RequestValidationError(
+            [
+                {**error, "loc": ("body", *error["loc"])}
+                for error in e.errors(include_url=False, include_input=not is_msgpack)
+            ]
+        )
+
+@lru_cache(maxsize=64)
+def _prefers_msgpack(accept: str) -> bool:
+    """
+    Decide from an Accept header whether to answer in MessagePack.
+
+    MessagePack is chosen only when it is listed explicitly with a non-zero
+    quality that is at least that of JSON (application/json, application/* or
+    */*); everything else gets the default JSON response.
+
+    Args:
+        accept: Accept header of the request
+
+    Returns:
+        True if the response should be MessagePack
+    """
+    msgpack_quality = json_quality = 0.0
+    for media_range in accept.split(","):
+        media_type, *params = (part.strip() for part in media_range.split(";"))
+        media_type = media_type.lower()
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if media_type == MSGPACK_MEDIA_TYPE:
+            msgpack_quality = max(msgpack_quality, quality)
+        elif media_type in ("application/json", "application/*", "*/*"):
+            json_quality = max(json_quality, quality)
+    return msgpack_quality > 0 and msgpack_quality >= json_quality
+
+async def recommend_jobs(request: RecommendationRequest) -> RecommendationResponse:
+    """
+    Rank job postings for a worker profile.
+
     Args:
         request: RecommendationRequest containing worker profile and job postings
-        
+
     Returns:
         RecommendationResponse with ranked job IDs
-        
+
     Raises:
-        HTTPException: If request validation fails or processing error occurs
+        HTTPException: If a processing error occurs
     """
     try:
-        logger.info(f"Processing recommendation request for {len(request.job_postings)} jobs")
+        request_job_ids, request_job_skills = request.job_columns()
+        logger.info(f"Processing recommendation request for {len(request_job_ids)} jobs")
 
         # Enhanced input validation
         if not request.worker_profile or not request.worker_profile.skills:
             logger.warning("Empty worker profile or skills")
             return RecommendationResponse(ranked_job_ids=[])
 
-        if not request.job_postings:
+        if not request_job_ids:
             logger.warning("No job postings provided")
             return RecommendationResponse(ranked_job_ids=[])
 
-        # Validate job postings structure
-        valid_job_count = sum(1 for job in request.job_postings
-                             if hasattr(job, 'id') and hasattr(job, 'required_skills')
-                             and job.id is not None)
-
-        if valid_job_count == 0:
-            logger.warning("No valid job postings found")
-            return RecommendationResponse(ranked_job_ids=[])
-
         # Preprocess worker skills
         processed_worker_skills = preprocess_text(request.worker_profile.skills)
 
@@ -228,10 +470,13 @@ async def get_job_recommendations(request: RecommendationRequest):
             logger.warning("Worker skills contain no meaningful content after preprocessing")
             return RecommendationResponse(ranked_job_ids=[])
 
-        # Calculate similarity scores
-        job_similarities = calculate_similarity_scores(processed_worker_skills, request.job_postings)
+        # Calculate similarity scores in the worker thread pool so CPU-bound
+        # scoring does not block the event loop for other requests
+        job_ids, scores = await run_in_threadpool(
+            calculate_similarity_scores, processed_worker_skills, request_job_ids, request_job_skills
+        )
 
-        if not job_similarities:
+        if not job_ids.size:
             logger.warning("No similarities calculated")
             return RecommendationResponse(ranked_job_ids=[])
 
@@ -239,22 +484,26 @@ async def get_job_recommendations(request: RecommendationRequest):
         MIN_SIMILARITY_THRESHOLD = 0.01  # Minimum similarity threshold
         MAX_RECOMMENDATIONS = 50  # Limit maximum recommendations
 
-        filtered_jobs = [
-            (job_id, score) for job_id, score in job_similarities
-            if score > MIN_SIMILARITY_THRESHOLD and isinstance(job_id, int) and job_id > 0
-        ]
+        mask = (scores > MIN_SIMILARITY_THRESHOLD) & (job_ids > 0)
+        job_ids, scores = job_ids[mask], scores[mask]
 
-        if not filtered_jobs:
+        if not job_ids.size:
             logger.warning("No jobs passed similarity threshold")
             return RecommendationResponse(ranked_job_ids=[])
 
-        # Sort by similarity score in descending order and limit results
-        ranked_jobs = sorted(filtered_jobs, key=lambda x: x[1], reverse=True)[:MAX_RECOMMENDATIONS]
+        # Find the k-th best score without a full sort, keep every job scoring
+        # at least that well (so all jobs tied at the cutoff are candidates),
+        # then stable-sort the candidates so ties keep their original job order
+        k = min(MAX_RECOMMENDATIONS, scores.size)
+        neg_scores = -scores
+        kth = np.partition(neg_scores, k - 1)[k - 1]
+        candidates = np.flatnonzero(neg_scores <= kth)
+        top = candidates[np.argsort(neg_scores[candidates], kind="stable")][:k]
 
         # Extract job IDs in ranked order
-        ranked_job_ids = [job_id for job_id, _ in ranked_jobs]
+        ranked_job_ids = job_ids[top].tolist()
 
-        logger.info(f"Returning {len(ranked_job_ids)} recommended jobs with scores ranging from {ranked_jobs[0][1]:.3f} to {ranked_jobs[-1][1]:.3f}")
+        logger.info(f"Returning {len(ranked_job_ids)} recommended jobs with scores ranging from {scores[top[0]]:.3f} to {scores[top[-1]]:.3f}")
 
         return RecommendationResponse(ranked_job_ids=ranked_job_ids)
         
@@ -265,6 +514,80 @@ async def get_job_recommendations(request: RecommendationRequest):
             detail=f"Internal server error: {str(e)}"
         )
 
+def warm_up() -> None:
+    """
+    Run a throwaway similarity calculation through the full scoring path.
+
+    This triggers the one-time costs (Numba compilation, lazy scikit-learn
+    and SciPy initialization) at startup instead of on the first request.
+    """
+    start_time = time.perf_counter()
+    calculate_similarity_scores(
+        preprocess_text("warmup skills"),
+        (1,),
+        ("warmup skills",)
+    )
+    logger.info(f"Scoring pipeline warmed up in {time.perf_counter() - start_time:.2f} seconds")
+
+@app.get("/")
+async def root():
+    """Health check endpoint."""
+    return {
+        "message": "WorkConnect AI Recommendation Service is running",
+        "status": "healthy",
+        "version": "1.0.0"
+    }
+
+@app.get("/health")
+async def health_check():
+    """Detailed health check endpoint."""
+    return {
+        "status": "healthy",
+        "service": "WorkConnect AI Recommendation Service",
+        "stopwords": len(ENGLISH_STOPWORDS)
+    }
+
+_REQUEST_BODY_SCHEMA = {"schema": _inline_schema_refs(_REQUEST_ADAPTER.json_schema())}
+
+@app.post(
+    "/recommendations/jobs",
+    response_model=RecommendationResponse,
+    responses={200: {"content": {MSGPACK_MEDIA_TYPE: {}}}},
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": _REQUEST_BODY_SCHEMA, MSGPACK_MEDIA_TYPE: _REQUEST_BODY_SCHEMA},
+            "required": True
+        }
+    }
+)
+async def get_job_recommendations(http_request: Request):
+    """
+    Get job recommendations based on worker profile and available jobs.
+
+    The request body may be JSON or MessagePack (Content-Type:
+    application/msgpack). The response is MessagePack when the Accept header
+    prefers application/msgpack over JSON, and JSON otherwise.
+    
+    Args:
+        http_request: HTTP request whose body is a RecommendationRequest
+        
+    Returns:
+        RecommendationResponse with ranked job IDs
+        
+    Raises:
+        RequestValidationError: If the request body fails validation
+        HTTPException: If the body encoding is unsupported or a processing error occurs
+    """
+    request = _parse_recommendation_request(
+        http_request.headers.get("content-type", "application/json"),
+        await http_request.body()
+    )
+    response = await recommend_jobs(request)
+
+    if msgpack is not None and _prefers_msgpack(http_request.headers.get("accept", "")):
+        return Response(content=msgpack.packb(response.model_dump()), media_type=MSGPACK_MEDIA_TYPE)
+    return response
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(